@@ -1,12 +1,13 @@
 import os
 import re
 import time
+from collections import defaultdict
 from dataclasses import dataclass, field
 import numpy as np
 import configparser
 import asyncio
 
-from typing import Any, Union, final
+from typing import Any, Callable, Union, final
 
 from ..base import (
     BaseGraphStorage,
@@ -16,7 +17,7 @@ from ..base import (
     DocStatus,
     DocStatusStorage,
 )
-from ..utils import logger, compute_mdhash_id, _cooperative_yield
+from ..utils import logger, compute_mdhash_id, _cooperative_yield, get_env_value
 from ..types import KnowledgeGraph, KnowledgeGraphNode, KnowledgeGraphEdge
 from ..constants import GRAPH_FIELD_SEP
 from .._version import __version__
@@ -28,18 +29,145 @@ if not pm.is_installed("pymongo"):
     pm.install("pymongo")
 
 from pymongo import AsyncMongoClient  # type: ignore
-from pymongo import UpdateOne  # type: ignore
+from pymongo import DeleteMany, ReadPreference, UpdateOne  # type: ignore
 from pymongo.asynchronous.database import AsyncDatabase  # type: ignore
 from pymongo.asynchronous.collection import AsyncCollection  # type: ignore
 from pymongo.operations import SearchIndexModel  # type: ignore
 from pymongo.driver_info import DriverInfo  # type: ignore
-from pymongo.errors import PyMongoError  # type: ignore
+from pymongo.errors import CollectionInvalid, PyMongoError  # type: ignore
+from bson.binary import Binary  # type: ignore
 
 config = configparser.ConfigParser()
 config.read("config.ini", "utf-8")
 
 GRAPH_BFS_MODE = os.getenv("MONGO_GRAPH_BFS_MODE", "bidirectional")
 
+# Number of concurrent bulk_write partitions for large unordered KV upserts;
+# each partition runs on its own pooled connection
+WRITE_PARTITIONS = max(1, get_env_value("MONGO_WRITE_PARTITIONS", 4, int))
+
+# Route read-only exploration queries (graph visualization, label listing,
+# document pagination/counts) to secondaries when the replica set has them.
+# Ingestion paths always read from the primary to observe their own writes.
+ALLOW_STALE_READS = get_env_value("MONGO_ALLOW_STALE_READS", False, bool)
+
+# Documents fetched per getMore when streaming potentially large result sets
+_CURSOR_BATCH_SIZE = 500
+
+# Upper bound on $in ids / $or clauses in a single filter; larger id or pair
+# lists are split into several filters (chunked reads and DeleteMany batches)
+_MAX_FILTER_CLAUSES = 1000
+
+# Smallest partition worth a separate concurrent bulk_write
+_MIN_WRITE_PARTITION_SIZE = 1000
+
+# Storage-internal fields stripped from documents before they are exposed as
+# KnowledgeGraphNode / KnowledgeGraphEdge properties
+_NODE_INTERNAL_FIELDS = ("_id", "connected_edges", "source_ids", "edge_count")
+_EDGE_INTERNAL_FIELDS = ("_id", "source_ids")
+# Server-side projection dropping those fields from fetched edge documents
+_EDGE_PROPERTIES_PROJECTION = {"_id": 0, "source_ids": 0}
+
+# Collection names known to exist, per database name (see get_or_create_collection)
+_collection_names_cache: dict[str, set[str]] = {}
+
+# (database, collection, index, embedding dim, quantization) keys whose vector
+# search index has already been verified or created in this process; the dim
+# and quantization are part of the key so a differently configured instance
+# still runs the compatibility checks
+_vector_indexes_ready: set[tuple[str, str, str, int, str]] = set()
+
+# Atlas Vector Search automatic quantization of indexed float vectors
+# ("none" keeps full-fidelity float32 vectors in the index)
+SUPPORTED_VECTOR_QUANTIZATIONS = {"none", "scalar", "binary"}
+
+# BSON binary vector (subtype 9) header for packed little-endian float32 data:
+# dtype byte 0x27 (BinaryVectorDtype.FLOAT32) followed by a zero padding byte
+_VECTOR_SUBTYPE = 9
+_FLOAT32_VECTOR_HEADER = b"\x27\x00"
+
+
+def _encode_vector(vector) -> Binary:
+    """Pack an embedding as a BSON float32 binary vector.
+
+    Atlas Vector Search indexes and queries binary vectors natively; packing
+    the raw float32 buffer avoids converting every dimension to a Python float
+    and stores 4 bytes per dimension instead of a BSON double array.
+    """
+    data = np.asarray(vector, dtype="<f4").tobytes()
+    return Binary(_FLOAT32_VECTOR_HEADER + data, _VECTOR_SUBTYPE)
+
+
+def _decode_vector(value) -> list[float]:
+    """Return a stored vector as a list of floats (binary or legacy array form).
+
+    np.frombuffer views the Binary payload in place, so the only conversion is
+    the final list[float] that BaseVectorStorage callers expect.
+    """
+    if isinstance(value, Binary) and value.subtype == _VECTOR_SUBTYPE:
+        return np.frombuffer(value, dtype="<f4", offset=2).tolist()
+    return value
+
+
+def _stale_readable(collection: AsyncCollection) -> AsyncCollection:
+    """Return collection configured for secondaryPreferred reads if allowed."""
+    if not ALLOW_STALE_READS:
+        return collection
+    return collection.with_options(read_preference=ReadPreference.SECONDARY_PREFERRED)
+
+
+async def _partitioned_bulk_write(
+    collection: AsyncCollection, operations: list[UpdateOne]
+) -> None:
+    """Run an unordered bulk_write as up to WRITE_PARTITIONS concurrent commands.
+
+    A single bulk_write is sent as sequential server batches over one
+    connection; splitting a large batch lets the shared client's connection
+    pool apply the partitions in parallel. Small batches stay a single command.
+    """
+    partitions = min(
+        WRITE_PARTITIONS, max(1, len(operations) // _MIN_WRITE_PARTITION_SIZE)
+    )
+    if partitions == 1:
+        await collection.bulk_write(operations, ordered=False)
+        return
+    size = -(-len(operations) // partitions)
+    await asyncio.gather(
+        *(
+            collection.bulk_write(operations[start : start + size], ordered=False)
+            for start in range(0, len(operations), size)
+        )
+    )
+
+
+def _ids_filter(ids: list[str]) -> dict[str, Any]:
+    return {"_id": {"$in": ids}}
+
+
+async def _chunked_delete_many(
+    collection: AsyncCollection,
+    ids: list[str],
+    build_filter: Callable[[list[str]], dict[str, Any]] = _ids_filter,
+) -> int:
+    """Delete documents matched by build_filter over ids; return deleted count.
+
+    Large id lists are split into DeleteMany operations of _MAX_FILTER_CLAUSES
+    ids sent in one unordered bulk_write, keeping every $in bounded well below
+    the 16MB command limit.
+    """
+    ids = list(ids)
+    if len(ids) <= _MAX_FILTER_CLAUSES:
+        result = await collection.delete_many(build_filter(ids))
+    else:
+        result = await collection.bulk_write(
+            [
+                DeleteMany(build_filter(ids[start : start + _MAX_FILTER_CLAUSES]))
+                for start in range(0, len(ids), _MAX_FILTER_CLAUSES)
+            ],
+            ordered=False,
+        )
+    return result.deleted_count
+
 
 class ClientManager:
     _instances = {"db": None, "ref_count": 0}
@@ -47,6 +175,12 @@ class ClientManager:
 
     @classmethod
     async def get_client(cls) -> AsyncMongoClient:
+        # Fast path: no await between the check and the increment, so this
+        # cannot interleave with release_client on the event loop
+        if cls._instances["db"] is not None:
+            cls._instances["ref_count"] += 1
+            return cls._instances["db"]
+
         async with cls._lock:
             if cls._instances["db"] is None:
                 uri = os.environ.get(
@@ -61,9 +195,32 @@ class ClientManager:
                     "MONGO_DATABASE",
                     config.get("mongodb", "database", fallback="LightRAG"),
                 )
+                # Connection pool shared by all Mongo storages in this process.
+                # Options are only passed when configured: keyword arguments
+                # override the URI, so unset ones keep URI/driver defaults
+                client_kwargs: dict[str, Any] = {}
+                for option, env_key, config_key in (
+                    ("maxPoolSize", "MONGO_MAX_POOL_SIZE", "max_pool_size"),
+                    ("minPoolSize", "MONGO_MIN_POOL_SIZE", "min_pool_size"),
+                    ("maxIdleTimeMS", "MONGO_MAX_IDLE_TIME_MS", "max_idle_time_ms"),
+                ):
+                    value = os.environ.get(
+                        env_key, config.get("mongodb", config_key, fallback="")
+                    )
+                    if value:
+                        client_kwargs[option] = int(value)
+                # Optional wire compression, e.g. "zstd,snappy,zlib" (zstd and
+                # snappy require the zstandard / python-snappy packages)
+                compressors = os.environ.get(
+                    "MONGO_COMPRESSORS",
+                    config.get("mongodb", "compressors", fallback=""),
+                )
+                if compressors:
+                    client_kwargs["compressors"] = compressors
                 client = AsyncMongoClient(
                     uri,
                     driver=DriverInfo(name="LightRAG", version=__version__),
+                    **client_kwargs,
                 )
                 db = client.get_database(database_name)
                 cls._instances["db"] = db
@@ -79,6 +236,8 @@ class ClientManager:
                     cls._instances["ref_count"] -= 1
                     if cls._instances["ref_count"] == 0:
                         cls._instances["db"] = None
+                        _collection_names_cache.clear()
+                        _vector_indexes_ready.clear()
 
 
 @final
@@ -175,9 +334,12 @@ class MongoKVStorage(BaseKVStorage):
         return ordered_results
 
     async def filter_keys(self, keys: set[str]) -> set[str]:
-        cursor = self._data.find({"_id": {"$in": list(keys)}}, {"_id": 1})
-        existing_ids = {str(x["_id"]) async for x in cursor}
-        return keys - existing_ids
+        if not keys:
+            return set()
+        # distinct returns the matching ids as one array instead of a cursor
+        # of single-field documents
+        existing_ids = await self._data.distinct("_id", {"_id": {"$in": list(keys)}})
+        return keys - set(map(str, existing_ids))
 
     async def upsert(self, data: dict[str, dict[str, Any]]) -> None:
         logger.debug(f"[{self.workspace}] Inserting {len(data)} to {self.namespace}")
@@ -185,16 +347,19 @@ class MongoKVStorage(BaseKVStorage):
             return
 
         # Unified handling for all namespaces with flattened keys
-        # Use bulk_write for better performance
+        # Use unordered bulk_writes: keys are unique, so the server is free to
+        # apply the updates in any order, and large batches are partitioned
+        # across concurrent commands (see _partitioned_bulk_write).
 
         operations = []
         current_time = int(time.time())  # Get current Unix timestamp
+        # Namespace classification is loop-invariant, evaluate it once per batch
+        is_text_chunks = self.namespace.endswith("text_chunks")
 
         for i, (k, v) in enumerate(data.items(), start=1):
             # For text_chunks namespace, ensure llm_cache_list field exists
-            if self.namespace.endswith("text_chunks"):
-                if "llm_cache_list" not in v:
-                    v["llm_cache_list"] = []
+            if is_text_chunks and "llm_cache_list" not in v:
+                v["llm_cache_list"] = []
 
             # Create a copy of v for $set operation, excluding create_time to avoid conflicts
             v_for_set = v.copy()
@@ -219,7 +384,7 @@ class MongoKVStorage(BaseKVStorage):
             await _cooperative_yield(i)
 
         if operations:
-            await self._data.bulk_write(operations)
+            await _partitioned_bulk_write(self._data, operations)
 
     async def index_done_callback(self) -> None:
         # Mongo handles persistence automatically
@@ -253,9 +418,9 @@ class MongoKVStorage(BaseKVStorage):
             ids = list(ids)
 
         try:
-            result = await self._data.delete_many({"_id": {"$in": ids}})
+            deleted_count = await _chunked_delete_many(self._data, ids)
             logger.info(
-                f"[{self.workspace}] Deleted {result.deleted_count} documents from {self.namespace}"
+                f"[{self.workspace}] Deleted {deleted_count} documents from {self.namespace}"
             )
         except PyMongoError as e:
             logger.error(
@@ -398,30 +563,36 @@ class MongoDocStatusStorage(DocStatusStorage):
         return ordered_results
 
     async def filter_keys(self, data: set[str]) -> set[str]:
-        cursor = self._data.find({"_id": {"$in": list(data)}}, {"_id": 1})
-        existing_ids = {str(x["_id"]) async for x in cursor}
-        return data - existing_ids
+        if not data:
+            return set()
+        existing_ids = await self._data.distinct("_id", {"_id": {"$in": list(data)}})
+        return data - set(map(str, existing_ids))
 
     async def upsert(self, data: dict[str, dict[str, Any]]) -> None:
         logger.debug(f"[{self.workspace}] Inserting {len(data)} to {self.namespace}")
         if not data:
             return
-        update_tasks: list[Any] = []
+        operations = []
         for i, (k, v) in enumerate(data.items(), start=1):
             # Ensure chunks_list field exists and is an array
             if "chunks_list" not in v:
                 v["chunks_list"] = []
             data[k]["_id"] = k
-            update_tasks.append(
-                self._data.update_one({"_id": k}, {"$set": v}, upsert=True)
-            )
+            operations.append(UpdateOne({"_id": k}, {"$set": v}, upsert=True))
             await _cooperative_yield(i)
-        await asyncio.gather(*update_tasks)
+
+        # One unordered bulk_write instead of one update_one round-trip per doc
+        await self._data.bulk_write(operations, ordered=False)
+
+    @property
+    def _read_data(self) -> AsyncCollection:
+        """Collection for read-only listing and counting queries."""
+        return _stale_readable(self._data)
 
     async def get_status_counts(self) -> dict[str, int]:
         """Get counts of documents in each status"""
         pipeline = [{"$group": {"_id": "$status", "count": {"$sum": 1}}}]
-        cursor = await self._data.aggregate(pipeline, allowDiskUse=True)
+        cursor = await self._read_data.aggregate(pipeline, allowDiskUse=True)
         result = await cursor.to_list()
         counts = {}
         for doc in result:
@@ -445,10 +616,12 @@ class MongoDocStatusStorage(DocStatusStorage):
         if not statuses:
             return {}
         status_values = [s.value for s in statuses]
-        cursor = self._data.find({"status": {"$in": status_values}})
-        docs = await cursor.to_list(length=None)
+        cursor = self._data.find(
+            {"status": {"$in": status_values}}, batch_size=_CURSOR_BATCH_SIZE
+        )
         result = {}
-        for doc in docs:
+        # Stream the cursor instead of materializing every raw document first
+        async for doc in cursor:
             try:
                 data = self._prepare_doc_status_data(doc)
                 result[doc["_id"]] = DocProcessingStatus(**data)
@@ -463,10 +636,9 @@ class MongoDocStatusStorage(DocStatusStorage):
         self, track_id: str
     ) -> dict[str, DocProcessingStatus]:
         """Get all documents with a specific track_id"""
-        cursor = self._data.find({"track_id": track_id})
-        result = await cursor.to_list()
+        cursor = self._data.find({"track_id": track_id}, batch_size=_CURSOR_BATCH_SIZE)
         processed_result = {}
-        for doc in result:
+        async for doc in cursor:
             try:
                 data = self._prepare_doc_status_data(doc)
                 processed_result[doc["_id"]] = DocProcessingStatus(**data)
@@ -519,7 +691,7 @@ class MongoDocStatusStorage(DocStatusStorage):
             return {"status": "error", "message": str(e)}
 
     async def delete(self, ids: list[str]) -> None:
-        await self._data.delete_many({"_id": {"$in": ids}})
+        await _chunked_delete_many(self._data, ids)
 
     async def create_and_migrate_indexes_if_not_exists(self):
         """Create indexes to optimize pagination queries and migrate file_path indexes for Chinese collation"""
@@ -662,7 +834,7 @@ class MongoDocStatusStorage(DocStatusStorage):
             query_filter["status"] = status_filter.value
 
         # Get total count
-        total_count = await self._data.count_documents(query_filter)
+        total_count = await self._read_data.count_documents(query_filter)
 
         # Calculate skip value
         skip = (page - 1) * page_size
@@ -675,7 +847,7 @@ class MongoDocStatusStorage(DocStatusStorage):
         if sort_field == "file_path":
             # Use Chinese collation for pinyin sorting
             cursor = (
-                self._data.find(query_filter)
+                self._read_data.find(query_filter)
                 .sort(sort_criteria)
                 .collation({"locale": "zh", "numericOrdering": True})
                 .skip(skip)
@@ -684,7 +856,7 @@ class MongoDocStatusStorage(DocStatusStorage):
         else:
             # Use default sorting for other fields
             cursor = (
-                self._data.find(query_filter)
+                self._read_data.find(query_filter)
                 .sort(sort_criteria)
                 .skip(skip)
                 .limit(page_size)
@@ -716,7 +888,7 @@ class MongoDocStatusStorage(DocStatusStorage):
             Dictionary mapping status names to counts, including 'all' field
         """
         pipeline = [{"$group": {"_id": "$status", "count": {"$sum": 1}}}]
-        cursor = await self._data.aggregate(pipeline, allowDiskUse=True)
+        cursor = await self._read_data.aggregate(pipeline, allowDiskUse=True)
         result = await cursor.to_list()
 
         counts = {}
@@ -809,6 +981,9 @@ class MongoGraphStorage(BaseGraphStorage):
                 self.db, self._edge_collection_name
             )
 
+            # Index edge endpoints so edge lookups avoid collection scans
+            await self.create_edge_indexes_if_not_exists()
+
             # Create Atlas Search index for better search performance if possible
             await self.create_search_index_if_not_exists()
 
@@ -858,6 +1033,16 @@ class MongoGraphStorage(BaseGraphStorage):
     # -------------------------------------------------------------------------
     #
 
+    @property
+    def _read_collection(self) -> AsyncCollection:
+        """Node collection for read-only exploration queries."""
+        return _stale_readable(self.collection)
+
+    @property
+    def _read_edge_collection(self) -> AsyncCollection:
+        """Edge collection for read-only exploration queries."""
+        return _stale_readable(self.edge_collection)
+
     async def has_node(self, node_id: str) -> bool:
         """
         Check if node_id is present in the collection by looking up its doc.
@@ -911,8 +1096,9 @@ class MongoGraphStorage(BaseGraphStorage):
         Returns:
             int: Sum of the degrees of both nodes
         """
-        src_degree = await self.node_degree(src_id)
-        trg_degree = await self.node_degree(tgt_id)
+        src_degree, trg_degree = await asyncio.gather(
+            self.node_degree(src_id), self.node_degree(tgt_id)
+        )
 
         return src_degree + trg_degree
 
@@ -964,7 +1150,7 @@ class MongoGraphStorage(BaseGraphStorage):
                     {"target_node_id": source_node_id},
                 ]
             },
-            {"source_node_id": 1, "target_node_id": 1},
+            {"_id": 0, "source_node_id": 1, "target_node_id": 1},
         )
 
         return [
@@ -979,34 +1165,43 @@ class MongoGraphStorage(BaseGraphStorage):
         return result
 
     async def node_degrees_batch(self, node_ids: list[str]) -> dict[str, int]:
-        # merge the outbound and inbound results with the same "_id" and sum the "degree"
-        merged_results = {}
-
-        # Outbound degrees
-        outbound_pipeline = [
-            {"$match": {"source_node_id": {"$in": node_ids}}},
-            {"$group": {"_id": "$source_node_id", "degree": {"$sum": 1}}},
-        ]
-
-        cursor = await self.edge_collection.aggregate(
-            outbound_pipeline, allowDiskUse=True
-        )
-        async for doc in cursor:
-            merged_results[doc.get("_id")] = doc.get("degree")
+        if not node_ids:
+            return {}
 
-        # Inbound degrees
-        inbound_pipeline = [
-            {"$match": {"target_node_id": {"$in": node_ids}}},
-            {"$group": {"_id": "$target_node_id", "degree": {"$sum": 1}}},
+        # Outbound and inbound degrees are computed in a single round-trip: the
+        # leading $match narrows the edges to those touching node_ids, then
+        # $facet groups them by each endpoint.
+        pipeline = [
+            {
+                "$match": {
+                    "$or": [
+                        {"source_node_id": {"$in": node_ids}},
+                        {"target_node_id": {"$in": node_ids}},
+                    ]
+                }
+            },
+            {
+                "$facet": {
+                    "outbound": [
+                        {"$match": {"source_node_id": {"$in": node_ids}}},
+                        {"$group": {"_id": "$source_node_id", "degree": {"$sum": 1}}},
+                    ],
+                    "inbound": [
+                        {"$match": {"target_node_id": {"$in": node_ids}}},
+                        {"$group": {"_id": "$target_node_id", "degree": {"$sum": 1}}},
+                    ],
+                }
+            },
         ]
 
-        cursor = await self.edge_collection.aggregate(
-            inbound_pipeline, allowDiskUse=True
-        )
-        async for doc in cursor:
-            merged_results[doc.get("_id")] = merged_results.get(
-                doc.get("_id"), 0
-            ) + doc.get("degree")
+        cursor = await self.edge_collection.aggregate(pipeline, allowDiskUse=True)
+        # merge the outbound and inbound results with the same "_id" and sum the "degree"
+        merged_results = {}
+        async for facets in cursor:
+            for doc in facets.get("outbound", []) + facets.get("inbound", []):
+                merged_results[doc["_id"]] = merged_results.get(
+                    doc["_id"], 0
+                ) + doc.get("degree", 0)
 
         return merged_results
 
@@ -1032,7 +1227,7 @@ class MongoGraphStorage(BaseGraphStorage):
         # Query outgoing edges (where node is the source)
         outgoing_cursor = self.edge_collection.find(
             {"source_node_id": {"$in": node_ids}},
-            {"source_node_id": 1, "target_node_id": 1},
+            {"_id": 0, "source_node_id": 1, "target_node_id": 1},
         )
         async for edge in outgoing_cursor:
             source = edge["source_node_id"]
@@ -1042,7 +1237,7 @@ class MongoGraphStorage(BaseGraphStorage):
         # Query incoming edges (where node is the target)
         incoming_cursor = self.edge_collection.find(
             {"target_node_id": {"$in": node_ids}},
-            {"source_node_id": 1, "target_node_id": 1},
+            {"_id": 0, "source_node_id": 1, "target_node_id": 1},
         )
         async for edge in incoming_cursor:
             source = edge["source_node_id"]
@@ -1051,12 +1246,87 @@ class MongoGraphStorage(BaseGraphStorage):
 
         return result
 
+    async def get_edges_batch(
+        self, pairs: list[dict[str, str]]
+    ) -> dict[tuple[str, str], dict]:
+        """Retrieve edge properties for multiple (src, tgt) pairs.
+
+        Edges are undirected, so each pair matches a stored edge in either
+        direction, consistent with get_edge(). Pairs are queried in chunks so
+        each $or holds at most _MAX_FILTER_CLAUSES clauses.
+
+        Args:
+            pairs: List of dictionaries, e.g. [{"src": "node1", "tgt": "node2"}, ...]
+
+        Returns:
+            A dictionary mapping (src, tgt) tuples to their edge properties.
+            Pairs without a matching edge are omitted.
+        """
+        if not pairs:
+            return {}
+
+        edges_by_key: dict[tuple[str, str], dict] = {}
+        pairs_per_query = max(1, _MAX_FILTER_CLAUSES // 2)
+        for start in range(0, len(pairs), pairs_per_query):
+            conditions = []
+            for pair in pairs[start : start + pairs_per_query]:
+                conditions.append(
+                    {"source_node_id": pair["src"], "target_node_id": pair["tgt"]}
+                )
+                conditions.append(
+                    {"source_node_id": pair["tgt"], "target_node_id": pair["src"]}
+                )
+
+            async for edge in self.edge_collection.find({"$or": conditions}):
+                key = (edge["source_node_id"], edge["target_node_id"])
+                edges_by_key.setdefault(key, edge)
+
+        result = {}
+        for pair in pairs:
+            src_id, tgt_id = pair["src"], pair["tgt"]
+            edge = edges_by_key.get((src_id, tgt_id)) or edges_by_key.get(
+                (tgt_id, src_id)
+            )
+            if edge is not None:
+                result[(src_id, tgt_id)] = edge
+        return result
+
     #
     # -------------------------------------------------------------------------
     # UPSERTS
     # -------------------------------------------------------------------------
     #
 
+    @staticmethod
+    def _build_edge_upsert(
+        source_node_id: str, target_node_id: str, edge_data: dict[str, str]
+    ) -> tuple[dict, dict]:
+        """Build the (filter, update) pair that upserts an undirected edge.
+
+        The filter matches the edge in either direction, so a single atomic
+        update either rewrites the existing edge in place or inserts it.
+        """
+        update_doc: dict = {"$set": {**edge_data}}
+        if edge_data.get("source_id", ""):
+            update_doc["$set"]["source_ids"] = edge_data["source_id"].split(
+                GRAPH_FIELD_SEP
+            )
+        update_doc["$set"]["source_node_id"] = source_node_id
+        update_doc["$set"]["target_node_id"] = target_node_id
+        edge_filter = {
+            "$or": [
+                {
+                    "source_node_id": source_node_id,
+                    "target_node_id": target_node_id,
+                },
+                {
+                    "source_node_id": target_node_id,
+                    "target_node_id": source_node_id,
+                },
+            ]
+        }
+        return edge_filter, update_doc
+
     async def upsert_node(self, node_id: str, node_data: dict[str, str]) -> None:
         """
         Insert or update a node document.
@@ -1073,37 +1343,21 @@ class MongoGraphStorage(BaseGraphStorage):
         self, source_node_id: str, target_node_id: str, edge_data: dict[str, str]
     ) -> None:
         """
-        Upsert an edge between source_node_id and target_node_id with optional 'relation'.
-        If an edge with the same target exists, we remove it and re-insert with updated data.
+        Upsert an edge between source_node_id and target_node_id.
+        An existing edge between the two nodes (in either direction) is updated in place.
         """
-        # Ensure source node exists
-        await self.upsert_node(source_node_id, {})
-
-        update_doc = {"$set": edge_data}
-        if edge_data.get("source_id", ""):
-            update_doc["$set"]["source_ids"] = edge_data["source_id"].split(
-                GRAPH_FIELD_SEP
-            )
-
-        edge_data["source_node_id"] = source_node_id
-        edge_data["target_node_id"] = target_node_id
-
-        await self.edge_collection.update_one(
-            {
-                "$or": [
-                    {
-                        "source_node_id": source_node_id,
-                        "target_node_id": target_node_id,
-                    },
-                    {
-                        "source_node_id": target_node_id,
-                        "target_node_id": source_node_id,
-                    },
-                ]
-            },
-            update_doc,
+        edge_filter, update_doc = self._build_edge_upsert(
+            source_node_id, target_node_id, edge_data
+        )
+        # Ensure source node exists without touching an existing document. The
+        # node write is awaited first so a failed node upsert never leaves an
+        # edge pointing at a missing node
+        await self.collection.update_one(
+            {"_id": source_node_id},
+            {"$setOnInsert": {"_id": source_node_id}},
             upsert=True,
         )
+        await self.edge_collection.update_one(edge_filter, update_doc, upsert=True)
 
     async def upsert_nodes_batch(self, nodes: list[tuple[str, dict[str, str]]]) -> None:
         """Batch insert/update multiple nodes using a single bulk_write() call.
@@ -1152,7 +1406,7 @@ class MongoGraphStorage(BaseGraphStorage):
         if not edges:
             return
 
-        # Ensure all source nodes exist (mirrors upsert_edge's upsert_node call)
+        # Ensure all source nodes exist (mirrors upsert_edge's node-ensure write)
         source_node_ids = list(dict.fromkeys(src for src, _tgt, _data in edges))
         node_ops = [
             UpdateOne({"_id": src}, {"$setOnInsert": {"_id": src}}, upsert=True)
@@ -1160,33 +1414,13 @@ class MongoGraphStorage(BaseGraphStorage):
         ]
         await self.collection.bulk_write(node_ops, ordered=False)
 
-        edge_ops = []
-        for source_node_id, target_node_id, edge_data in edges:
-            update_doc: dict = {"$set": {**edge_data}}
-            if edge_data.get("source_id", ""):
-                update_doc["$set"]["source_ids"] = edge_data["source_id"].split(
-                    GRAPH_FIELD_SEP
-                )
-            update_doc["$set"]["source_node_id"] = source_node_id
-            update_doc["$set"]["target_node_id"] = target_node_id
-            edge_ops.append(
-                UpdateOne(
-                    {
-                        "$or": [
-                            {
-                                "source_node_id": source_node_id,
-                                "target_node_id": target_node_id,
-                            },
-                            {
-                                "source_node_id": target_node_id,
-                                "target_node_id": source_node_id,
-                            },
-                        ]
-                    },
-                    update_doc,
-                    upsert=True,
-                )
+        edge_ops = [
+            UpdateOne(
+                *self._build_edge_upsert(source_node_id, target_node_id, edge_data),
+                upsert=True,
             )
+            for source_node_id, target_node_id, edge_data in edges
+        ]
         await self.edge_collection.bulk_write(edge_ops, ordered=True)
 
     #
@@ -1197,8 +1431,11 @@ class MongoGraphStorage(BaseGraphStorage):
 
     async def delete_node(self, node_id: str) -> None:
         """
-        1) Remove node's doc entirely.
-        2) Remove inbound & outbound edges from any doc that references node_id.
+        1) Remove inbound & outbound edges referencing node_id from the edge collection.
+        2) Remove node's doc entirely.
+
+        The edge filter only targets the node's own edges and is served by the
+        endpoint indexes, so the cost is O(degree) rather than a collection scan.
         """
         # Remove all edges
         await self.edge_collection.delete_many(
@@ -1221,53 +1458,54 @@ class MongoGraphStorage(BaseGraphStorage):
             [id1, id2, ...]  # Alphabetically sorted id list
         """
 
-        # Use aggregation with allowDiskUse for large datasets
-        pipeline = [{"$project": {"_id": 1}}, {"$sort": {"_id": 1}}]
-        cursor = await self.collection.aggregate(pipeline, allowDiskUse=True)
-        labels = []
-        async for doc in cursor:
-            labels.append(doc["_id"])
-        return labels
+        # Walk the _id index in order (covered query, no in-memory sort); a
+        # cursor is used rather than distinct() whose single-document reply is
+        # capped at 16MB
+        cursor = self._read_collection.find(
+            {}, {"_id": 1}, sort=[("_id", 1)], batch_size=_CURSOR_BATCH_SIZE
+        )
+        return [doc["_id"] async for doc in cursor]
 
     def _construct_graph_node(
         self, node_id, node_data: dict[str, str]
     ) -> KnowledgeGraphNode:
-        return KnowledgeGraphNode(
-            id=node_id,
-            labels=[node_id],
-            properties={
-                k: v
-                for k, v in node_data.items()
-                if k
-                not in [
-                    "_id",
-                    "connected_edges",
-                    "source_ids",
-                    "edge_count",
-                ]
-            },
-        )
+        """Build a graph node, consuming node_data (internal fields are popped in place)."""
+        for key in _NODE_INTERNAL_FIELDS:
+            node_data.pop(key, None)
+        return KnowledgeGraphNode(id=node_id, labels=[node_id], properties=node_data)
 
     def _construct_graph_edge(self, edge_id: str, edge: dict[str, str]):
+        """Build a graph edge, consuming edge (internal fields are popped in place)."""
+        edge_type = edge.pop("relationship", "")
+        source = edge.pop("source_node_id")
+        target = edge.pop("target_node_id")
+        for key in _EDGE_INTERNAL_FIELDS:
+            edge.pop(key, None)
         return KnowledgeGraphEdge(
             id=edge_id,
-            type=edge.get("relationship", ""),
-            source=edge["source_node_id"],
-            target=edge["target_node_id"],
-            properties={
-                k: v
-                for k, v in edge.items()
-                if k
-                not in [
-                    "_id",
-                    "source_node_id",
-                    "target_node_id",
-                    "relationship",
-                    "source_ids",
-                ]
-            },
+            type=edge_type,
+            source=source,
+            target=target,
+            properties=edge,
         )
 
+    def _append_unique_edge(
+        self,
+        result: KnowledgeGraph,
+        seen_edges: set[tuple[str, str]],
+        edge: dict[str, Any],
+    ) -> None:
+        """Append edge to result unless its (source, target) pair was already seen.
+
+        Called once per edge so callers can stream edge cursors straight through.
+        """
+        edge_key = (edge["source_node_id"], edge["target_node_id"])
+        if edge_key not in seen_edges:
+            seen_edges.add(edge_key)
+            result.edges.append(
+                self._construct_graph_edge(f"{edge_key[0]}-{edge_key[1]}", edge)
+            )
+
     async def _fetch_nodes_by_ids(
         self, node_ids: list[str], projection: dict[str, int] | None = None
     ) -> list[dict[str, Any]]:
@@ -1275,7 +1513,7 @@ class MongoGraphStorage(BaseGraphStorage):
         if not node_ids:
             return []
 
-        cursor = self.collection.find({"_id": {"$in": node_ids}}, projection)
+        cursor = self._read_collection.find({"_id": {"$in": node_ids}}, projection)
         docs_by_id = {}
         async for doc in cursor:
             docs_by_id[str(doc["_id"])] = doc
@@ -1289,9 +1527,9 @@ class MongoGraphStorage(BaseGraphStorage):
         while its neighbor is not.  Then this node might seem like disconnected in UI.
         """
 
-        total_node_count = await self.collection.count_documents({})
+        total_node_count = await self._read_collection.count_documents({})
         result = KnowledgeGraph()
-        seen_edges = set()
+        seen_edges: set[tuple[str, str]] = set()
 
         result.is_truncated = total_node_count > max_nodes
         if result.is_truncated:
@@ -1317,7 +1555,9 @@ class MongoGraphStorage(BaseGraphStorage):
                 {"$sort": {"degree": -1}},
                 {"$limit": max_nodes},
             ]
-            cursor = await self.edge_collection.aggregate(pipeline, allowDiskUse=True)
+            cursor = await self._read_edge_collection.aggregate(
+                pipeline, allowDiskUse=True
+            )
 
             node_ids = []
             async for doc in cursor:
@@ -1326,41 +1566,45 @@ class MongoGraphStorage(BaseGraphStorage):
 
             if len(node_ids) < max_nodes:
                 remaining = max_nodes - len(node_ids)
-                cursor = self.collection.find(
+                cursor = self._read_collection.find(
                     {"_id": {"$nin": node_ids}},
-                    {"source_ids": 0},
+                    {"_id": 1},
                 ).limit(remaining)
                 async for doc in cursor:
                     node_ids.append(str(doc["_id"]))
 
             docs = await self._fetch_nodes_by_ids(node_ids, {"source_ids": 0})
-            for doc in docs:
-                result.nodes.append(self._construct_graph_node(doc["_id"], doc))
+            result.nodes.extend(
+                self._construct_graph_node(doc["_id"], doc) for doc in docs
+            )
 
             # As node count reaches the limit, only need to fetch the edges that directly connect to these nodes
-            edge_cursor = self.edge_collection.find(
+            edge_cursor = self._read_edge_collection.find(
                 {
                     "$and": [
                         {"source_node_id": {"$in": node_ids}},
                         {"target_node_id": {"$in": node_ids}},
                     ]
-                }
+                },
+                _EDGE_PROPERTIES_PROJECTION,
             )
         else:
             # All nodes and edges are needed
-            cursor = self.collection.find({}, {"source_ids": 0})
+            cursor = self._read_collection.find(
+                {}, {"source_ids": 0}, batch_size=_CURSOR_BATCH_SIZE
+            )
 
+            append_node = result.nodes.append
             async for doc in cursor:
-                node_id = str(doc["_id"])
-                result.nodes.append(self._construct_graph_node(doc["_id"], doc))
+                append_node(self._construct_graph_node(doc["_id"], doc))
 
-            edge_cursor = self.edge_collection.find({})
+            edge_cursor = self._read_edge_collection.find(
+                {}, _EDGE_PROPERTIES_PROJECTION, batch_size=_CURSOR_BATCH_SIZE
+            )
 
+        append_unique_edge = self._append_unique_edge
         async for edge in edge_cursor:
-            edge_id = f"{edge['source_node_id']}-{edge['target_node_id']}"
-            if edge_id not in seen_edges:
-                seen_edges.add(edge_id)
-                result.edges.append(self._construct_graph_edge(edge_id, edge))
+            append_unique_edge(result, seen_edges, edge)
 
         return result
 
@@ -1376,33 +1620,42 @@ class MongoGraphStorage(BaseGraphStorage):
         if depth > max_depth or len(result.nodes) > max_nodes:
             return result
 
-        cursor = self.collection.find({"_id": {"$in": node_labels}})
+        cursor = self._read_collection.find(
+            {"_id": {"$in": node_labels}}, {"source_ids": 0}
+        )
 
+        nodes = result.nodes
+        append_node = nodes.append
+        mark_seen = seen_nodes.add
         async for node in cursor:
             node_id = node["_id"]
             if node_id not in seen_nodes:
-                seen_nodes.add(node_id)
-                result.nodes.append(self._construct_graph_node(node_id, node))
-                if len(result.nodes) > max_nodes:
+                mark_seen(node_id)
+                append_node(self._construct_graph_node(node_id, node))
+                if len(nodes) > max_nodes:
                     return result
 
         # Collect neighbors
-        # Get both inbound and outbound one hop nodes
-        cursor = self.edge_collection.find(
+        # Get both inbound and outbound one hop nodes, only endpoints are needed
+        cursor = self._read_edge_collection.find(
             {
                 "$or": [
                     {"source_node_id": {"$in": node_labels}},
                     {"target_node_id": {"$in": node_labels}},
                 ]
-            }
+            },
+            {"_id": 0, "source_node_id": 1, "target_node_id": 1},
         )
 
         neighbor_nodes = []
+        append_neighbor = neighbor_nodes.append
         async for edge in cursor:
-            if edge["source_node_id"] not in seen_nodes:
-                neighbor_nodes.append(edge["source_node_id"])
-            if edge["target_node_id"] not in seen_nodes:
-                neighbor_nodes.append(edge["target_node_id"])
+            source = edge["source_node_id"]
+            target = edge["target_node_id"]
+            if source not in seen_nodes:
+                append_neighbor(source)
+            if target not in seen_nodes:
+                append_neighbor(target)
 
         if neighbor_nodes:
             result = await self._bidirectional_bfs_nodes(
@@ -1419,7 +1672,7 @@ class MongoGraphStorage(BaseGraphStorage):
         max_nodes: int,
     ) -> KnowledgeGraph:
         seen_nodes = set()
-        seen_edges = set()
+        seen_edges: set[tuple[str, str]] = set()
         result = KnowledgeGraph()
 
         result = await self._bidirectional_bfs_nodes(
@@ -1428,20 +1681,19 @@ class MongoGraphStorage(BaseGraphStorage):
 
         # Get all edges from seen_nodes
         all_node_ids = list(seen_nodes)
-        cursor = self.edge_collection.find(
+        cursor = self._read_edge_collection.find(
             {
                 "$and": [
                     {"source_node_id": {"$in": all_node_ids}},
                     {"target_node_id": {"$in": all_node_ids}},
                 ]
-            }
+            },
+            _EDGE_PROPERTIES_PROJECTION,
         )
 
+        append_unique_edge = self._append_unique_edge
         async for edge in cursor:
-            edge_id = f"{edge['source_node_id']}-{edge['target_node_id']}"
-            if edge_id not in seen_edges:
-                result.edges.append(self._construct_graph_edge(edge_id, edge))
-                seen_edges.add(edge_id)
+            append_unique_edge(result, seen_edges, edge)
 
         return result
 
@@ -1449,17 +1701,20 @@ class MongoGraphStorage(BaseGraphStorage):
         self, node_label: str, max_depth: int, max_nodes: int
     ) -> KnowledgeGraph:
         seen_nodes = set()
-        seen_edges = set()
+        seen_edges: set[tuple[str, str]] = set()
         result = KnowledgeGraph()
-        project_doc = {
-            "source_ids": 0,
-            "created_at": 0,
-            "entity_type": 0,
-            "file_path": 0,
+        # The start node document is fetched separately, so the lookup roots only
+        # carry _id and the traversed edges are stripped of internal fields
+        project_doc = {"_id": 1}
+        project_edges = {
+            "connected_edges._id": 0,
+            "connected_edges.source_ids": 0,
         }
 
         # Verify if starting node exists
-        start_node = await self.collection.find_one({"_id": node_label})
+        start_node = await self._read_collection.find_one(
+            {"_id": node_label}, {"source_ids": 0}
+        )
         if not start_node:
             logger.warning(
                 f"[{self.workspace}] Starting node with label {node_label} does not exist!"
@@ -1489,6 +1744,7 @@ class MongoGraphStorage(BaseGraphStorage):
                     "as": "connected_edges",
                 },
             },
+            {"$project": project_edges},
             {
                 "$unionWith": {
                     "coll": self._collection_name,
@@ -1506,12 +1762,13 @@ class MongoGraphStorage(BaseGraphStorage):
                                 "as": "connected_edges",
                             }
                         },
+                        {"$project": project_edges},
                     ],
                 }
             },
         ]
 
-        cursor = await self.collection.aggregate(pipeline, allowDiskUse=True)
+        cursor = await self._read_collection.aggregate(pipeline, allowDiskUse=True)
         node_edges = []
 
         # Two records for node_label are returned capturing outbound and inbound connected_edges
@@ -1529,32 +1786,37 @@ class MongoGraphStorage(BaseGraphStorage):
         # As order matters, we need to use another list to store the node_id
         # And only take the first max_nodes ones
         node_ids = []
+        append_node_id = node_ids.append
+        mark_seen_node = seen_nodes.add
         for edge in node_edges:
-            if len(node_ids) < max_nodes and edge["source_node_id"] not in seen_nodes:
-                node_ids.append(edge["source_node_id"])
-                seen_nodes.add(edge["source_node_id"])
+            if len(node_ids) >= max_nodes:
+                break
+            source = edge["source_node_id"]
+            if source not in seen_nodes:
+                append_node_id(source)
+                mark_seen_node(source)
 
-            if len(node_ids) < max_nodes and edge["target_node_id"] not in seen_nodes:
-                node_ids.append(edge["target_node_id"])
-                seen_nodes.add(edge["target_node_id"])
+            target = edge["target_node_id"]
+            if len(node_ids) < max_nodes and target not in seen_nodes:
+                append_node_id(target)
+                mark_seen_node(target)
 
         # Filter out all the node whose id is same as node_label so that we do not check existence next step
-        cursor = self.collection.find({"_id": {"$in": node_ids}})
+        cursor = self._read_collection.find(
+            {"_id": {"$in": node_ids}}, {"source_ids": 0}
+        )
 
+        append_node = result.nodes.append
         async for doc in cursor:
-            result.nodes.append(self._construct_graph_node(str(doc["_id"]), doc))
+            append_node(self._construct_graph_node(str(doc["_id"]), doc))
 
+        append_unique_edge = self._append_unique_edge
         for edge in node_edges:
             if (
-                edge["source_node_id"] not in seen_nodes
-                or edge["target_node_id"] not in seen_nodes
+                edge["source_node_id"] in seen_nodes
+                and edge["target_node_id"] in seen_nodes
             ):
-                continue
-
-            edge_id = f"{edge['source_node_id']}-{edge['target_node_id']}"
-            if edge_id not in seen_edges:
-                result.edges.append(self._construct_graph_edge(edge_id, edge))
-                seen_edges.add(edge_id)
+                append_unique_edge(result, seen_edges, edge)
 
         return result
 
@@ -1633,7 +1895,7 @@ class MongoGraphStorage(BaseGraphStorage):
                 )
                 # Fallback to a simple query without complex aggregation
                 try:
-                    simple_cursor = self.collection.find({}).limit(max_nodes)
+                    simple_cursor = self._read_collection.find({}).limit(max_nodes)
                     async for doc in simple_cursor:
                         result.nodes.append(
                             self._construct_graph_node(str(doc["_id"]), doc)
@@ -1665,20 +1927,25 @@ class MongoGraphStorage(BaseGraphStorage):
         if not nodes:
             return
 
-        # 1. Remove all edges referencing these nodes
-        await self.edge_collection.delete_many(
-            {
+        # 1. Remove all edges referencing these nodes; each $or branch is served
+        # by an endpoint index, so only the nodes' own edges are visited
+        edge_count = await _chunked_delete_many(
+            self.edge_collection,
+            nodes,
+            lambda chunk: {
                 "$or": [
-                    {"source_node_id": {"$in": nodes}},
-                    {"target_node_id": {"$in": nodes}},
+                    {"source_node_id": {"$in": chunk}},
+                    {"target_node_id": {"$in": chunk}},
                 ]
-            }
+            },
         )
 
         # 2. Delete the node documents
-        await self.collection.delete_many({"_id": {"$in": nodes}})
+        node_count = await _chunked_delete_many(self.collection, nodes)
 
-        logger.debug(f"[{self.workspace}] Successfully deleted nodes: {nodes}")
+        logger.debug(
+            f"[{self.workspace}] Deleted {node_count} nodes and {edge_count} edges"
+        )
 
     async def remove_edges(self, edges: list[tuple[str, str]]) -> None:
         """Delete multiple edges
@@ -1690,18 +1957,32 @@ class MongoGraphStorage(BaseGraphStorage):
         if not edges:
             return
 
-        all_edge_pairs = []
+        # Edges are undirected: collect the peers of each endpoint so the filter
+        # has one {source, target $in} clause per endpoint instead of two
+        # clauses per edge, each still served by the compound edge index
+        peers: dict[str, list[str]] = defaultdict(list)
         for source_id, target_id in edges:
-            all_edge_pairs.append(
-                {"source_node_id": source_id, "target_node_id": target_id}
-            )
-            all_edge_pairs.append(
-                {"source_node_id": target_id, "target_node_id": source_id}
-            )
+            peers[source_id].append(target_id)
+            peers[target_id].append(source_id)
 
-        await self.edge_collection.delete_many({"$or": all_edge_pairs})
+        clauses = [
+            {"source_node_id": node_id, "target_node_id": {"$in": targets}}
+            for node_id, targets in peers.items()
+        ]
+        # Large deletions are split into several DeleteMany operations sent in
+        # one unordered bulk_write, so no single filter grows without bound and
+        # no per-chunk requests are fanned out concurrently
+        result = await self.edge_collection.bulk_write(
+            [
+                DeleteMany({"$or": clauses[start : start + _MAX_FILTER_CLAUSES]})
+                for start in range(0, len(clauses), _MAX_FILTER_CLAUSES)
+            ],
+            ordered=False,
+        )
 
-        logger.debug(f"[{self.workspace}] Successfully deleted edges: {edges}")
+        logger.debug(
+            f"[{self.workspace}] Deleted {result.deleted_count} of {len(edges)} edges"
+        )
 
     async def get_all_nodes(self) -> list[dict]:
         """Get all nodes in the graph.
@@ -1783,7 +2064,9 @@ class MongoGraphStorage(BaseGraphStorage):
                 {"$project": {"_id": 1}},
             ]
 
-            cursor = await self.edge_collection.aggregate(pipeline, allowDiskUse=True)
+            cursor = await self._read_edge_collection.aggregate(
+                pipeline, allowDiskUse=True
+            )
             labels = []
             async for doc in cursor:
                 if doc.get("_id"):
@@ -2092,6 +2375,48 @@ class MongoGraphStorage(BaseGraphStorage):
             f"[{self.workspace}] Index will be built asynchronously, using regex fallback until ready."
         )
 
+    async def create_edge_indexes_if_not_exists(self):
+        """Create indexes on edge endpoints used by every edge lookup.
+
+        The compound (source_node_id, target_node_id) index serves exact edge
+        matches in either direction as well as source-only queries; the
+        target_node_id index serves inbound-edge queries. Together they back
+        both connectToField directions of the in/out-bound $graphLookup, so
+        every traversal hop is an index seek rather than a collection scan.
+        """
+        all_indexes = [
+            {
+                "name": "source_node_id_target_node_id",
+                "keys": [("source_node_id", 1), ("target_node_id", 1)],
+            },
+            {"name": "target_node_id", "keys": [("target_node_id", 1)]},
+        ]
+
+        try:
+            indexes_cursor = await self.edge_collection.list_indexes()
+            existing_indexes = await indexes_cursor.to_list(length=None)
+            existing_index_names = {idx.get("name", "") for idx in existing_indexes}
+
+            for index_info in all_indexes:
+                index_name = index_info["name"]
+                if index_name in existing_index_names:
+                    continue
+                try:
+                    await self.edge_collection.create_index(
+                        index_info["keys"], name=index_name
+                    )
+                    logger.debug(
+                        f"[{self.workspace}] Created index '{index_name}' for collection {self._edge_collection_name}"
+                    )
+                except PyMongoError as create_error:
+                    logger.error(
+                        f"[{self.workspace}] Failed to create index '{index_name}' for collection {self._edge_collection_name}: {create_error}"
+                    )
+        except PyMongoError as e:
+            logger.error(
+                f"[{self.workspace}] Error creating indexes for {self._edge_collection_name}: {e}"
+            )
+
     async def create_search_index_if_not_exists(self):
         """Creates an improved Atlas Search index for entity search, rebuilding if necessary."""
         index_name = "entity_id_search_idx"
@@ -2229,9 +2554,32 @@ class MongoVectorDBStorage(BaseVectorStorage):
                 "cosine_better_than_threshold must be specified in vector_db_storage_cls_kwargs"
             )
         self.cosine_better_than_threshold = cosine_threshold
+
+        self._quantization = os.environ.get("MONGO_VECTOR_QUANTIZATION", "none").lower()
+        if self._quantization not in SUPPORTED_VECTOR_QUANTIZATIONS:
+            raise ValueError(
+                f"Unsupported MONGO_VECTOR_QUANTIZATION: {self._quantization}. "
+                f"Supported values: {sorted(SUPPORTED_VECTOR_QUANTIZATIONS)}"
+            )
+
         self._collection_name = self.final_namespace
         self._max_batch_size = self.global_config["embedding_batch_num"]
 
+        # Query-independent stages appended after $vectorSearch in query()
+        self._search_result_stages = (
+            {"$addFields": {"score": {"$meta": "vectorSearchScore"}}},
+            {"$match": {"score": {"$gte": self.cosine_better_than_threshold}}},
+            {"$project": {"vector": 0}},
+            # Shape results server-side into the format expected by callers
+            {
+                "$addFields": {
+                    "id": "$_id",
+                    "distance": "$score",
+                    "created_at": {"$ifNull": ["$created_at", None]},
+                }
+            },
+        )
+
     async def initialize(self):
         async with get_data_init_lock():
             if self.db is None:
@@ -2254,6 +2602,18 @@ class MongoVectorDBStorage(BaseVectorStorage):
 
     async def create_vector_index_if_not_exists(self):
         """Creates an Atlas Vector Search index."""
+        # Skip the list_search_indexes() round trip for indexes this process has
+        # already verified (e.g. other storages re-initializing, drop())
+        index_key = (
+            self._data.database.name,
+            self._collection_name,
+            self._index_name,
+            self.embedding_func.embedding_dim,
+            self._quantization,
+        )
+        if index_key in _vector_indexes_ready:
+            return
+
         try:
             indexes_cursor = await self._data.list_search_indexes()
             indexes = await indexes_cursor.to_list(length=None)
@@ -2261,6 +2621,7 @@ class MongoVectorDBStorage(BaseVectorStorage):
                 if index["name"] == self._index_name:
                     # Check if the existing index has matching vector dimensions
                     existing_dim = None
+                    existing_quantization = "none"
                     definition = index.get("latestDefinition", {})
                     fields = definition.get("fields", [])
                     for field in fields:
@@ -2269,6 +2630,7 @@ class MongoVectorDBStorage(BaseVectorStorage):
                             and field.get("path") == "vector"
                         ):
                             existing_dim = field.get("numDimensions")
+                            existing_quantization = field.get("quantization", "none")
                             break
 
                     expected_dim = self.embedding_func.embedding_dim
@@ -2283,27 +2645,37 @@ class MongoVectorDBStorage(BaseVectorStorage):
                         logger.error(f"[{self.workspace}] {error_msg}")
                         raise ValueError(error_msg)
 
+                    if existing_quantization != self._quantization:
+                        logger.warning(
+                            f"[{self.workspace}] Vector index {self._index_name} uses quantization "
+                            f"'{existing_quantization}' but MONGO_VECTOR_QUANTIZATION is "
+                            f"'{self._quantization}'; drop the index to rebuild it with the new setting"
+                        )
+
                     logger.info(
                         f"[{self.workspace}] vector index {self._index_name} already exists with matching dimensions ({expected_dim})"
                     )
+                    _vector_indexes_ready.add(index_key)
                     return
 
+            vector_field = {
+                "type": "vector",
+                "numDimensions": self.embedding_func.embedding_dim,  # Ensure correct dimensions
+                "path": "vector",
+                "similarity": "cosine",  # Options: euclidean, cosine, dotProduct
+            }
+            if self._quantization != "none":
+                # Atlas quantizes the indexed vectors itself and rescores with the
+                # stored float32 vectors, so documents keep full precision
+                vector_field["quantization"] = self._quantization
             search_index_model = SearchIndexModel(
-                definition={
-                    "fields": [
-                        {
-                            "type": "vector",
-                            "numDimensions": self.embedding_func.embedding_dim,  # Ensure correct dimensions
-                            "path": "vector",
-                            "similarity": "cosine",  # Options: euclidean, cosine, dotProduct
-                        }
-                    ]
-                },
+                definition={"fields": [vector_field]},
                 name=self._index_name,
                 type="vectorSearch",
             )
 
             await self._data.create_search_index(search_index_model)
+            _vector_indexes_ready.add(index_key)
             logger.info(
                 f"[{self.workspace}] Vector index {self._index_name} created successfully."
             )
@@ -2323,41 +2695,51 @@ class MongoVectorDBStorage(BaseVectorStorage):
         # Add current time as Unix timestamp
         current_time = int(time.time())
 
+        # Probe the few meta fields in each record rather than filtering every
+        # key of every record against them
+        meta_fields = frozenset(self.meta_fields)
         list_data = []
         for i, (k, v) in enumerate(data.items(), start=1):
             list_data.append(
                 {
                     "_id": k,
                     "created_at": current_time,  # Add created_at field as Unix timestamp
-                    **{k1: v1 for k1, v1 in v.items() if k1 in self.meta_fields},
+                    **{mf: v[mf] for mf in meta_fields if mf in v},
                 }
             )
             await _cooperative_yield(i)
         contents = [v["content"] for v in data.values()]
-        batches = [
-            contents[i : i + self._max_batch_size]
-            for i in range(0, len(contents), self._max_batch_size)
-        ]
 
-        embedding_tasks = [
-            self.embedding_func(batch, context="document") for batch in batches
-        ]
-        embeddings_list = await asyncio.gather(*embedding_tasks)
-        embeddings = np.concatenate(embeddings_list)
-        assert len(embeddings) == len(
-            list_data
-        ), f"Embedding count mismatch: expected {len(list_data)}, got {len(embeddings)}"
-        for i, d in enumerate(list_data, start=1):
-            d["vector"] = np.array(embeddings[i - 1], dtype=np.float32).tolist()
-            await _cooperative_yield(i)
-
-        update_tasks = []
-        for i, doc in enumerate(list_data, start=1):
-            update_tasks.append(
-                self._data.update_one({"_id": doc["_id"]}, {"$set": doc}, upsert=True)
+        async def _embed_and_write(start: int) -> None:
+            # Each batch is written as soon as its embeddings arrive, so database
+            # writes overlap with the embedding calls still in flight
+            docs = list_data[start : start + self._max_batch_size]
+            embeddings = await self.embedding_func(
+                contents[start : start + self._max_batch_size], context="document"
+            )
+            assert len(embeddings) == len(
+                docs
+            ), f"Embedding count mismatch: expected {len(docs)}, got {len(embeddings)}"
+            # Cast the batch to float32 once and pack rows straight from it
+            for doc, row in zip(docs, np.asarray(embeddings, dtype="<f4")):
+                doc["vector"] = _encode_vector(row)
+
+            # One unordered bulk_write per embedding batch instead of one
+            # update_one per document
+            await self._data.bulk_write(
+                [
+                    UpdateOne({"_id": doc["_id"]}, {"$set": doc}, upsert=True)
+                    for doc in docs
+                ],
+                ordered=False,
+            )
+
+        await asyncio.gather(
+            *(
+                _embed_and_write(start)
+                for start in range(0, len(list_data), self._max_batch_size)
             )
-            await _cooperative_yield(i)
-        await asyncio.gather(*update_tasks)
+        )
 
         return list_data
 
@@ -2365,21 +2747,18 @@ class MongoVectorDBStorage(BaseVectorStorage):
         self, query: str, top_k: int, query_embedding: list[float] = None
     ) -> list[dict[str, Any]]:
         """Queries the vector database using Atlas Vector Search."""
-        if query_embedding is not None:
-            # Convert numpy array to list if needed for MongoDB compatibility
-            if hasattr(query_embedding, "tolist"):
-                query_vector = query_embedding.tolist()
-            else:
-                query_vector = list(query_embedding)
-        else:
+        if query_embedding is None:
             # Generate the embedding
             embedding = await self.embedding_func(
                 [query], context="query", _priority=5
             )  # higher priority for query
-            # Convert numpy array to a list to ensure compatibility with MongoDB
-            query_vector = embedding[0].tolist()
+            query_embedding = embedding[0]
+        # Send the query as a packed float32 binary vector, matching the stored
+        # vector format instead of a BSON array of doubles
+        query_vector = _encode_vector(query_embedding)
 
-        # Define the aggregation pipeline with the converted query vector
+        # Only the $vectorSearch stage depends on the query; the remaining
+        # stages are built once in __post_init__ and shared (never mutated)
         pipeline = [
             {
                 "$vectorSearch": {
@@ -2390,25 +2769,12 @@ class MongoVectorDBStorage(BaseVectorStorage):
                     "limit": top_k,
                 }
             },
-            {"$addFields": {"score": {"$meta": "vectorSearchScore"}}},
-            {"$match": {"score": {"$gte": self.cosine_better_than_threshold}}},
-            {"$project": {"vector": 0}},
+            *self._search_result_stages,
         ]
 
-        # Execute the aggregation pipeline
-        cursor = await self._data.aggregate(pipeline, allowDiskUse=True)
-        results = await cursor.to_list(length=None)
-
-        # Format and return the results with created_at field
-        return [
-            {
-                **doc,
-                "id": doc["_id"],
-                "distance": doc.get("score", None),
-                "created_at": doc.get("created_at"),  # Include created_at field
-            }
-            for doc in results
-        ]
+        # At most top_k documents come back, so fetch them in a single batch
+        cursor = await self._data.aggregate(pipeline, batchSize=top_k)
+        return await cursor.to_list(length=top_k)
 
     async def index_done_callback(self) -> None:
         # Mongo handles persistence automatically
@@ -2431,9 +2797,9 @@ class MongoVectorDBStorage(BaseVectorStorage):
             ids = list(ids)
 
         try:
-            result = await self._data.delete_many({"_id": {"$in": ids}})
+            deleted_count = await _chunked_delete_many(self._data, ids)
             logger.debug(
-                f"[{self.workspace}] Successfully deleted {result.deleted_count} vectors from {self.namespace}"
+                f"[{self.workspace}] Successfully deleted {deleted_count} vectors from {self.namespace}"
             )
         except PyMongoError as e:
             logger.error(
@@ -2473,26 +2839,17 @@ class MongoVectorDBStorage(BaseVectorStorage):
             entity_name: Name of the entity whose relations should be deleted
         """
         try:
-            # Find relations where entity appears as source or target
-            relations_cursor = self._data.find(
+            # Delete relations where entity appears as source or target directly,
+            # without first fetching the matching documents
+            result = await self._data.delete_many(
                 {"$or": [{"src_id": entity_name}, {"tgt_id": entity_name}]}
             )
-            relations = await relations_cursor.to_list(length=None)
-
-            if not relations:
+            if result.deleted_count == 0:
                 logger.debug(
                     f"[{self.workspace}] No relations found for entity {entity_name}"
                 )
                 return
 
-            # Extract IDs of relations to delete
-            relation_ids = [relation["_id"] for relation in relations]
-            logger.debug(
-                f"[{self.workspace}] Found {len(relation_ids)} relations for entity {entity_name}"
-            )
-
-            # Delete the relations
-            result = await self._data.delete_many({"_id": {"$in": relation_ids}})
             logger.debug(
                 f"[{self.workspace}] Deleted {result.deleted_count} relations for {entity_name}"
             )
@@ -2501,12 +2858,6 @@ class MongoVectorDBStorage(BaseVectorStorage):
                 f"[{self.workspace}] Error deleting relations for {entity_name}: {str(e)}"
             )
 
-        except PyMongoError as e:
-            logger.error(
-                f"[{self.workspace}] Error searching by prefix in {self.namespace}: {str(e)}"
-            )
-            return []
-
     async def get_by_id(self, id: str) -> dict[str, Any] | None:
         """Get vector data by its ID
 
@@ -2524,6 +2875,8 @@ class MongoVectorDBStorage(BaseVectorStorage):
                 result_dict = dict(result)
                 if "_id" in result_dict and "id" not in result_dict:
                     result_dict["id"] = result_dict["_id"]
+                if "vector" in result_dict:
+                    result_dict["vector"] = _decode_vector(result_dict["vector"])
                 return result_dict
             return None
         except Exception as e:
@@ -2555,6 +2908,8 @@ class MongoVectorDBStorage(BaseVectorStorage):
                 result_dict = dict(result)
                 if "_id" in result_dict and "id" not in result_dict:
                     result_dict["id"] = result_dict["_id"]
+                if "vector" in result_dict:
+                    result_dict["vector"] = _decode_vector(result_dict["vector"])
                 key = str(result_dict.get("id", result_dict.get("_id")))
                 formatted_map[key] = result_dict
 
@@ -2590,8 +2945,8 @@ class MongoVectorDBStorage(BaseVectorStorage):
             vectors_dict = {}
             for result in results:
                 if result and "vector" in result and "_id" in result:
-                    # MongoDB stores vectors as arrays, so they should already be lists
-                    vectors_dict[result["_id"]] = result["vector"]
+                    # Vectors are stored as binary float32 (or arrays for legacy data)
+                    vectors_dict[result["_id"]] = _decode_vector(result["vector"])
 
             return vectors_dict
         except PyMongoError as e:
@@ -2629,12 +2984,46 @@ class MongoVectorDBStorage(BaseVectorStorage):
 
 
 async def get_or_create_collection(db: AsyncDatabase, collection_name: str):
-    collection_names = await db.list_collection_names()
+    # Collection names are listed once per database and reused by every storage
+    # initialized afterwards; collections are never dropped by these storages
+    collection_names = _collection_names_cache.get(db.name)
+    if collection_names is None:
+        collection_names = set(await db.list_collection_names())
+        _collection_names_cache[db.name] = collection_names
 
     if collection_name not in collection_names:
-        collection = await db.create_collection(collection_name)
-        logger.info(f"Created collection: {collection_name}")
+        try:
+            collection = await db.create_collection(collection_name)
+            logger.info(f"Created collection: {collection_name}")
+        except CollectionInvalid:
+            # Created by another process since the names were listed
+            logger.debug(f"Collection '{collection_name}' already exists.")
+            collection = db.get_collection(collection_name)
+        collection_names.add(collection_name)
         return collection
     else:
         logger.debug(f"Collection '{collection_name}' already exists.")
         return db.get_collection(collection_name)
+
+
+def id_prefix_filter(prefix: str) -> dict[str, Any]:
+    """Build an index-usable `_id` range filter matching keys that start with prefix.
+
+    Equivalent to {"_id": {"$regex": f"^{prefix}"}} but expressed as a
+    half-open range, so the server seeks the `_id` B-tree directly instead of
+    evaluating a regex. Incrementing the last code point preserves ordering
+    because MongoDB compares strings by their UTF-8 bytes; the surrogate block
+    is skipped since BSON cannot encode it, and trailing U+10FFFF characters
+    are dropped before incrementing. A prefix made only of U+10FFFF has no
+    upper bound, so only `$gte` is applied.
+    """
+    if not prefix:
+        return {}
+    stem = prefix.rstrip("\U0010ffff")
+    if not stem:
+        return {"_id": {"$gte": prefix}}
+    next_code_point = ord(stem[-1]) + 1
+    if 0xD800 <= next_code_point <= 0xDFFF:
+        next_code_point = 0xE000
+    upper_bound = stem[:-1] + chr(next_code_point)
+    return {"_id": {"$gte": prefix, "$lt": upper_bound}}
@@ -378,6 +378,8 @@ class CleanupTool:
         Returns:
             Dictionary with counts for each mode and cache_type
         """
+        from lightrag.kg.mongo_impl import id_prefix_filter
+
         counts = {mode: {"query": 0, "keywords": 0} for mode in QUERY_MODES}
 
         print("Counting MongoDB documents...", end="", flush=True)
@@ -385,8 +387,7 @@ class CleanupTool:
 
         for mode in QUERY_MODES:
             for cache_type in CACHE_TYPES:
-                pattern = f"^{mode}:{cache_type}:"
-                query = {"_id": {"$regex": pattern}}
+                query = id_prefix_filter(f"{mode}:{cache_type}:")
                 count = await storage._data.count_documents(query)
                 counts[mode][cache_type] = count
 
@@ -659,42 +660,53 @@ class CleanupTool:
             cleanup_type: 'all', 'query', or 'keywords'
             stats: CleanupStats object to track progress
         """
-        # Build regex patterns
+        from pymongo import DeleteMany
+        from pymongo.errors import BulkWriteError
+        from lightrag.kg.mongo_impl import id_prefix_filter
+
+        # Build key prefixes, matched with index-usable _id range queries
         patterns = []
         for mode in QUERY_MODES:
             if cleanup_type == "all":
-                patterns.append(f"^{mode}:query:")
-                patterns.append(f"^{mode}:keywords:")
+                patterns.append(f"{mode}:query:")
+                patterns.append(f"{mode}:keywords:")
             elif cleanup_type == "query":
-                patterns.append(f"^{mode}:query:")
+                patterns.append(f"{mode}:query:")
             elif cleanup_type == "keywords":
-                patterns.append(f"^{mode}:keywords:")
+                patterns.append(f"{mode}:keywords:")
+
+        if not patterns:
+            return
 
         print("\n=== Starting Cleanup ===")
-        print("💡 Executing MongoDB deleteMany operations\n")
+        print("💡 Executing MongoDB deleteMany operations in one bulk write\n")
 
+        # One round-trip for all prefixes; each DeleteMany seeks the _id index
+        operations = [DeleteMany(id_prefix_filter(pattern)) for pattern in patterns]
+        stats.total_batches += 1
         total_deleted = 0
-        for idx, pattern in enumerate(patterns, 1):
-            try:
-                query = {"_id": {"$regex": pattern}}
-                result = await storage._data.delete_many(query)
-                deleted_count = result.deleted_count
+        try:
+            result = await storage._data.bulk_write(operations, ordered=False)
+            total_deleted = result.deleted_count
 
-                stats.total_batches += 1
-                stats.successful_batches += 1
-                stats.successfully_deleted += deleted_count
-                total_deleted += deleted_count
+            stats.successful_batches += 1
+            stats.successfully_deleted += total_deleted
 
-                print(
-                    f"Pattern {idx}/{len(patterns)}: Deleted {deleted_count:,} records ✓"
-                )
+            print(f"{len(patterns)} patterns: Deleted {total_deleted:,} records ✓")
 
-            except Exception as e:
-                stats.add_error(idx, e, 0)
-                print(
-                    f"Pattern {idx}/{len(patterns)}: ✗ FAILED - "
-                    f"{type(e).__name__}: {str(e)}"
-                )
+        except BulkWriteError as e:
+            # Unordered bulk writes keep going past failed operations
+            total_deleted = e.details.get("nRemoved", 0)
+            stats.successfully_deleted += total_deleted
+            stats.add_error(1, e, 0)
+            print(
+                f"{len(patterns)} patterns: ✗ PARTIAL - deleted {total_deleted:,} "
+                f"records before {type(e).__name__}: {str(e)}"
+            )
+
+        except Exception as e:
+            stats.add_error(1, e, 0)
+            print(f"{len(patterns)} patterns: ✗ FAILED - {type(e).__name__}: {str(e)}")
 
         print(f"\nTotal deleted: {total_deleted:,} records")
 
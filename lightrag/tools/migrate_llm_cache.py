@@ -454,6 +454,22 @@ class MigrationTool:
 
         return cache_data
 
+    @staticmethod
+    def _default_cache_mongo_filter() -> Dict[str, Any]:
+        """MongoDB filter for default:extract:* and default:summary:* keys
+
+        Uses _id prefix ranges instead of an alternation regex so the server
+        can seek the _id index rather than scanning the collection.
+        """
+        from lightrag.kg.mongo_impl import id_prefix_filter
+
+        return {
+            "$or": [
+                id_prefix_filter("default:extract:"),
+                id_prefix_filter("default:summary:"),
+            ]
+        }
+
     async def get_default_caches_mongo(
         self, storage, batch_size: int = 1000
     ) -> Dict[str, Any]:
@@ -468,8 +484,8 @@ class MigrationTool:
         """
         cache_data = {}
 
-        # MongoDB query with regex - use _data not collection
-        query = {"_id": {"$regex": "^default:(extract|summary):"}}
+        # MongoDB _id prefix range query - use _data not collection
+        query = self._default_cache_mongo_filter()
 
         # Use cursor without to_list() - process in batches
         cursor = storage._data.find(query).batch_size(batch_size)
@@ -624,7 +640,7 @@ class MigrationTool:
         Returns:
             Total count of cache records
         """
-        query = {"_id": {"$regex": "^default:(extract|summary):"}}
+        query = self._default_cache_mongo_filter()
 
         print("Counting MongoDB documents...", end="", flush=True)
         start_time = time.time()
@@ -859,7 +875,7 @@ class MigrationTool:
         Yields:
             Dictionary batches of cache entries
         """
-        query = {"_id": {"$regex": "^default:(extract|summary):"}}
+        query = self._default_cache_mongo_filter()
         cursor = storage._data.find(query).batch_size(batch_size)
 
         batch = {}
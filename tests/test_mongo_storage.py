@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock
@@ -7,7 +8,18 @@ pytest.importorskip(
     reason="pymongo is required for Mongo storage tests",
 )
 
-from lightrag.kg.mongo_impl import MongoGraphStorage
+from lightrag.kg.mongo_impl import (
+    ClientManager,
+    MongoDocStatusStorage,
+    MongoGraphStorage,
+    MongoKVStorage,
+    MongoVectorDBStorage,
+    _decode_vector,
+    _encode_vector,
+    get_or_create_collection,
+    id_prefix_filter,
+)
+from pymongo.errors import PyMongoError
 
 pytestmark = pytest.mark.offline
 
@@ -95,3 +107,671 @@ class TestMongoGraphStorage:
         assert len(result.edges) == 1
         assert result.edges[0].source == "A"
         assert result.edges[0].target == "B"
+
+    @pytest.mark.asyncio
+    async def test_get_knowledge_graph_all_keeps_edges_with_dashed_ids_distinct(
+        self,
+    ):
+        storage = self._make_storage()
+        storage.collection.count_documents = AsyncMock(return_value=4)
+        storage.collection.find = Mock(
+            return_value=_AsyncCursor(
+                [{"_id": "a-b"}, {"_id": "c"}, {"_id": "a"}, {"_id": "b-c"}]
+            )
+        )
+        # Both edges format to the display ID "a-b-c" but are different pairs
+        storage.edge_collection.find = Mock(
+            return_value=_AsyncCursor(
+                [
+                    {"source_node_id": "a-b", "target_node_id": "c"},
+                    {"source_node_id": "a", "target_node_id": "b-c"},
+                    {"source_node_id": "a", "target_node_id": "b-c"},
+                ]
+            )
+        )
+
+        result = await storage.get_knowledge_graph_all_by_degree(
+            max_depth=2, max_nodes=10
+        )
+
+        assert [(edge.source, edge.target) for edge in result.edges] == [
+            ("a-b", "c"),
+            ("a", "b-c"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_bidirectional_bfs_collects_neighbors_and_edges_once(self):
+        storage = self._make_storage()
+
+        def collection_find_side_effect(query, projection=None):
+            return _AsyncCursor(
+                [{"_id": node_id} for node_id in dict.fromkeys(query["_id"]["$in"])]
+            )
+
+        def edge_find_side_effect(query, projection=None):
+            if "$or" in query:
+                labels = set(query["$or"][0]["source_node_id"]["$in"])
+                return _AsyncCursor(
+                    edge
+                    for edge in edges
+                    if edge["source_node_id"] in labels
+                    or edge["target_node_id"] in labels
+                )
+            return _AsyncCursor(dict(edge) for edge in edges)
+
+        edges = [
+            {"source_node_id": "A", "target_node_id": "B"},
+            {"source_node_id": "C", "target_node_id": "A"},
+            {"source_node_id": "A", "target_node_id": "B"},
+        ]
+        storage.collection.find = Mock(side_effect=collection_find_side_effect)
+        storage.edge_collection.find = Mock(side_effect=edge_find_side_effect)
+
+        result = await storage.get_knowledge_subgraph_bidirectional_bfs(
+            "A", 0, max_depth=1, max_nodes=10
+        )
+
+        assert [node.id for node in result.nodes] == ["A", "B", "C"]
+        assert [edge.id for edge in result.edges] == ["A-B", "C-A"]
+
+    @pytest.mark.asyncio
+    async def test_fallback_search_uses_single_case_insensitive_regex_query(self):
+        storage = self._make_storage()
+        cursor = Mock()
+        cursor.limit.return_value.to_list = AsyncMock(
+            return_value=[{"_id": "Old Apple"}, {"_id": "application"}, {"_id": "App"}]
+        )
+        storage.collection.find = Mock(return_value=cursor)
+
+        labels = await storage._fallback_regex_search("App", limit=10)
+
+        storage.collection.find.assert_called_once_with(
+            {"_id": {"$regex": "App", "$options": "i"}}, {"_id": 1}
+        )
+        assert labels == ["App", "application", "Old Apple"]
+
+    @pytest.mark.asyncio
+    async def test_upsert_edge_is_single_bidirectional_update(self):
+        storage = self._make_storage()
+        storage.collection.update_one = AsyncMock()
+        storage.edge_collection.update_one = AsyncMock()
+        edge_data = {"weight": 1.0, "source_id": "chunk-1<SEP>chunk-2"}
+
+        await storage.upsert_edge("A", "B", edge_data)
+
+        storage.edge_collection.update_one.assert_awaited_once()
+        edge_filter, update_doc = storage.edge_collection.update_one.await_args.args
+        assert edge_filter == {
+            "$or": [
+                {"source_node_id": "A", "target_node_id": "B"},
+                {"source_node_id": "B", "target_node_id": "A"},
+            ]
+        }
+        assert update_doc["$set"]["source_node_id"] == "A"
+        assert update_doc["$set"]["target_node_id"] == "B"
+        assert update_doc["$set"]["source_ids"] == ["chunk-1", "chunk-2"]
+        assert storage.edge_collection.update_one.await_args.kwargs["upsert"] is True
+        # The caller's edge_data must not be mutated
+        assert edge_data == {"weight": 1.0, "source_id": "chunk-1<SEP>chunk-2"}
+        # The source node is only created if missing, never overwritten
+        storage.collection.update_one.assert_awaited_once_with(
+            {"_id": "A"}, {"$setOnInsert": {"_id": "A"}}, upsert=True
+        )
+
+    @pytest.mark.asyncio
+    async def test_upsert_edge_skips_edge_when_node_upsert_fails(self):
+        storage = self._make_storage()
+        storage.collection.update_one = AsyncMock(side_effect=PyMongoError("down"))
+        storage.edge_collection.update_one = AsyncMock()
+
+        with pytest.raises(PyMongoError):
+            await storage.upsert_edge("A", "B", {"weight": 1.0})
+
+        storage.edge_collection.update_one.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_get_edges_batch_matches_both_directions_in_one_query(self):
+        storage = self._make_storage()
+        storage.edge_collection.find = Mock(
+            return_value=_AsyncCursor(
+                [
+                    {"source_node_id": "A", "target_node_id": "B", "weight": 1.0},
+                    {"source_node_id": "D", "target_node_id": "C", "weight": 2.0},
+                ]
+            )
+        )
+
+        result = await storage.get_edges_batch(
+            [
+                {"src": "A", "tgt": "B"},
+                {"src": "C", "tgt": "D"},
+                {"src": "E", "tgt": "F"},
+            ]
+        )
+
+        storage.edge_collection.find.assert_called_once()
+        assert set(result) == {("A", "B"), ("C", "D")}
+        assert result[("C", "D")]["weight"] == 2.0
+
+    @pytest.mark.asyncio
+    async def test_get_edges_batch_bounds_or_clauses_per_query(self, monkeypatch):
+        monkeypatch.setattr("lightrag.kg.mongo_impl._MAX_FILTER_CLAUSES", 4)
+        storage = self._make_storage()
+        storage.edge_collection.find = Mock(
+            side_effect=[
+                _AsyncCursor(
+                    [{"source_node_id": "A", "target_node_id": "B", "weight": 1.0}]
+                ),
+                _AsyncCursor(
+                    [{"source_node_id": "F", "target_node_id": "E", "weight": 3.0}]
+                ),
+            ]
+        )
+
+        result = await storage.get_edges_batch(
+            [
+                {"src": "A", "tgt": "B"},
+                {"src": "C", "tgt": "D"},
+                {"src": "E", "tgt": "F"},
+            ]
+        )
+
+        assert storage.edge_collection.find.call_count == 2
+        for call in storage.edge_collection.find.call_args_list:
+            assert len(call.args[0]["$or"]) <= 4
+        assert set(result) == {("A", "B"), ("E", "F")}
+
+    @pytest.mark.asyncio
+    async def test_node_degrees_batch_uses_single_facet_aggregation(self):
+        storage = self._make_storage()
+        storage.edge_collection.aggregate = AsyncMock(
+            return_value=_AsyncCursor(
+                [
+                    {
+                        "outbound": [{"_id": "A", "degree": 2}],
+                        "inbound": [
+                            {"_id": "A", "degree": 1},
+                            {"_id": "B", "degree": 3},
+                        ],
+                    }
+                ]
+            )
+        )
+
+        degrees = await storage.node_degrees_batch(["A", "B", "C"])
+
+        storage.edge_collection.aggregate.assert_awaited_once()
+        assert degrees == {"A": 3, "B": 3}
+
+    @pytest.mark.asyncio
+    async def test_create_edge_indexes_only_creates_missing_indexes(self):
+        storage = self._make_storage()
+        storage.edge_collection.list_indexes = AsyncMock(
+            return_value=Mock(
+                to_list=AsyncMock(
+                    return_value=[{"name": "_id_"}, {"name": "target_node_id"}]
+                )
+            )
+        )
+        storage.edge_collection.create_index = AsyncMock()
+
+        await storage.create_edge_indexes_if_not_exists()
+
+        storage.edge_collection.create_index.assert_awaited_once_with(
+            [("source_node_id", 1), ("target_node_id", 1)],
+            name="source_node_id_target_node_id",
+        )
+
+    @pytest.mark.asyncio
+    async def test_create_edge_indexes_covers_both_traversal_directions(self):
+        storage = self._make_storage()
+        storage.edge_collection.list_indexes = AsyncMock(
+            return_value=Mock(to_list=AsyncMock(return_value=[{"name": "_id_"}]))
+        )
+        storage.edge_collection.create_index = AsyncMock()
+
+        await storage.create_edge_indexes_if_not_exists()
+
+        created = [
+            call.args[0]
+            for call in storage.edge_collection.create_index.await_args_list
+        ]
+        # Leading keys serve $graphLookup connectToField in each direction
+        assert {keys[0][0] for keys in created} == {"source_node_id", "target_node_id"}
+
+    @pytest.mark.asyncio
+    async def test_remove_nodes_only_targets_edges_of_deleted_nodes(self):
+        storage = self._make_storage()
+        storage.edge_collection.delete_many = AsyncMock()
+        storage.collection.delete_many = AsyncMock()
+
+        await storage.remove_nodes(["A", "B"])
+
+        storage.edge_collection.delete_many.assert_awaited_once_with(
+            {
+                "$or": [
+                    {"source_node_id": {"$in": ["A", "B"]}},
+                    {"target_node_id": {"$in": ["A", "B"]}},
+                ]
+            }
+        )
+        storage.collection.delete_many.assert_awaited_once_with(
+            {"_id": {"$in": ["A", "B"]}}
+        )
+
+    @pytest.mark.asyncio
+    async def test_remove_edges_groups_peers_per_endpoint(self):
+        storage = self._make_storage()
+        storage.edge_collection.bulk_write = AsyncMock()
+
+        await storage.remove_edges([("A", "B"), ("A", "C")])
+
+        storage.edge_collection.bulk_write.assert_awaited_once()
+        (operation,) = storage.edge_collection.bulk_write.await_args.args[0]
+        assert operation._filter == {
+            "$or": [
+                {"source_node_id": "A", "target_node_id": {"$in": ["B", "C"]}},
+                {"source_node_id": "B", "target_node_id": {"$in": ["A"]}},
+                {"source_node_id": "C", "target_node_id": {"$in": ["A"]}},
+            ]
+        }
+
+    @pytest.mark.asyncio
+    async def test_remove_edges_splits_large_deletions(self, monkeypatch):
+        monkeypatch.setattr("lightrag.kg.mongo_impl._MAX_FILTER_CLAUSES", 2)
+        storage = self._make_storage()
+        storage.edge_collection.bulk_write = AsyncMock()
+
+        await storage.remove_edges([("A", "B"), ("C", "D")])
+
+        operations = storage.edge_collection.bulk_write.await_args.args[0]
+        assert [len(op._filter["$or"]) for op in operations] == [2, 2]
+        assert storage.edge_collection.bulk_write.await_args.kwargs["ordered"] is False
+
+    @pytest.mark.asyncio
+    async def test_get_all_labels_reads_id_index_in_order(self):
+        storage = self._make_storage()
+        storage.collection.find = Mock(
+            return_value=_AsyncCursor([{"_id": "A"}, {"_id": "B"}])
+        )
+
+        labels = await storage.get_all_labels()
+
+        assert labels == ["A", "B"]
+        args, kwargs = storage.collection.find.call_args
+        assert args == ({}, {"_id": 1})
+        assert kwargs["sort"] == [("_id", 1)]
+
+    def test_construct_graph_node_and_edge_strip_internal_fields(self):
+        storage = self._make_storage()
+
+        node = storage._construct_graph_node(
+            "A",
+            {"_id": "A", "source_ids": ["c1"], "entity_type": "person"},
+        )
+        edge = storage._construct_graph_edge(
+            "A-B",
+            {
+                "_id": "oid",
+                "source_node_id": "A",
+                "target_node_id": "B",
+                "relationship": "knows",
+                "source_ids": ["c1"],
+                "weight": 1.0,
+            },
+        )
+
+        assert node.properties == {"entity_type": "person"}
+        assert (edge.source, edge.target, edge.type) == ("A", "B", "knows")
+        assert edge.properties == {"weight": 1.0}
+
+
+class TestMongoKVStorage:
+    def _make_storage(self, namespace="text_chunks"):
+        storage = MongoKVStorage.__new__(MongoKVStorage)
+        storage.workspace = "test"
+        storage.namespace = namespace
+        storage._data = AsyncMock()
+        return storage
+
+    @pytest.mark.asyncio
+    async def test_upsert_uses_single_unordered_bulk_write(self):
+        storage = self._make_storage()
+
+        await storage.upsert({"chunk-1": {"content": "a"}, "chunk-2": {"content": "b"}})
+
+        storage._data.bulk_write.assert_awaited_once()
+        ops = storage._data.bulk_write.await_args.args[0]
+        assert [op._filter for op in ops] == [{"_id": "chunk-1"}, {"_id": "chunk-2"}]
+        assert storage._data.bulk_write.await_args.kwargs["ordered"] is False
+        assert ops[0]._doc["$set"]["llm_cache_list"] == []
+
+    @pytest.mark.asyncio
+    async def test_upsert_partitions_large_batches(self, monkeypatch):
+        monkeypatch.setattr("lightrag.kg.mongo_impl.WRITE_PARTITIONS", 3)
+        monkeypatch.setattr("lightrag.kg.mongo_impl._MIN_WRITE_PARTITION_SIZE", 2)
+        storage = self._make_storage(namespace="full_docs")
+
+        await storage.upsert({f"doc-{i}": {"content": str(i)} for i in range(7)})
+
+        calls = storage._data.bulk_write.await_args_list
+        assert [len(call.args[0]) for call in calls] == [3, 3, 1]
+        assert all(call.kwargs["ordered"] is False for call in calls)
+
+    @pytest.mark.asyncio
+    async def test_delete_splits_large_id_lists(self, monkeypatch):
+        monkeypatch.setattr("lightrag.kg.mongo_impl._MAX_FILTER_CLAUSES", 2)
+        storage = self._make_storage()
+        storage._data.bulk_write = AsyncMock(
+            return_value=SimpleNamespace(deleted_count=3)
+        )
+
+        await storage.delete(["a", "b", "c"])
+
+        storage._data.delete_many.assert_not_awaited()
+        operations = storage._data.bulk_write.await_args.args[0]
+        assert [op._filter for op in operations] == [
+            {"_id": {"$in": ["a", "b"]}},
+            {"_id": {"$in": ["c"]}},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_filter_keys_uses_distinct(self):
+        storage = self._make_storage()
+        storage._data.distinct = AsyncMock(return_value=["chunk-1"])
+
+        missing = await storage.filter_keys({"chunk-1", "chunk-2"})
+
+        assert missing == {"chunk-2"}
+        field_name, query = storage._data.distinct.await_args.args
+        assert field_name == "_id"
+        assert sorted(query["_id"]["$in"]) == ["chunk-1", "chunk-2"]
+
+
+class TestMongoDocStatusStorage:
+    def _make_storage(self):
+        storage = MongoDocStatusStorage.__new__(MongoDocStatusStorage)
+        storage.workspace = "test"
+        storage.namespace = "doc_status"
+        storage._data = AsyncMock()
+        return storage
+
+    @pytest.mark.asyncio
+    async def test_upsert_uses_single_bulk_write(self):
+        storage = self._make_storage()
+
+        await storage.upsert(
+            {
+                "doc-1": {"status": "pending"},
+                "doc-2": {"status": "processed", "chunks_list": ["chunk-1"]},
+            }
+        )
+
+        storage._data.update_one.assert_not_called()
+        storage._data.bulk_write.assert_awaited_once()
+        ops = storage._data.bulk_write.await_args.args[0]
+        assert [op._filter for op in ops] == [{"_id": "doc-1"}, {"_id": "doc-2"}]
+        assert ops[0]._doc["$set"]["chunks_list"] == []
+        assert ops[1]._doc["$set"]["chunks_list"] == ["chunk-1"]
+
+
+def test_id_prefix_filter_builds_half_open_range():
+    assert id_prefix_filter("mix:query:") == {
+        "_id": {"$gte": "mix:query:", "$lt": "mix:query;"}
+    }
+    assert id_prefix_filter("") == {}
+
+
+def test_id_prefix_filter_handles_code_points_without_successor():
+    assert id_prefix_filter("a\ud7ff") == {"_id": {"$gte": "a\ud7ff", "$lt": "a\ue000"}}
+    assert id_prefix_filter("a\U0010ffff") == {
+        "_id": {"$gte": "a\U0010ffff", "$lt": "b"}
+    }
+    assert id_prefix_filter("\U0010ffff") == {"_id": {"$gte": "\U0010ffff"}}
+
+
+class TestMongoVectorDBStorage:
+    def _make_storage(self, dim=4):
+        storage = MongoVectorDBStorage.__new__(MongoVectorDBStorage)
+        storage.workspace = "test"
+        storage.namespace = "chunks"
+        storage.meta_fields = {"content"}
+        storage._collection_name = "chunks"
+        storage._max_batch_size = 2
+
+        async def embedding_func(texts, **kwargs):
+            return np.array([[float(len(t))] * dim for t in texts], dtype=np.float64)
+
+        storage.embedding_func = embedding_func
+        storage._data = AsyncMock()
+        return storage
+
+    def test_vector_binary_roundtrip(self):
+        vector = np.array([0.5, -1.25, 3.0], dtype=np.float32)
+
+        encoded = _encode_vector(vector)
+
+        assert encoded.subtype == 9
+        assert len(encoded) == 2 + 3 * 4
+        assert _decode_vector(encoded) == [0.5, -1.25, 3.0]
+        # Legacy array-form vectors are returned unchanged
+        assert _decode_vector([0.1, 0.2]) == [0.1, 0.2]
+
+    @pytest.mark.asyncio
+    async def test_get_vectors_by_ids_reads_legacy_float_list_documents(self):
+        storage = self._make_storage()
+        storage._data.find = Mock(
+            return_value=Mock(
+                to_list=AsyncMock(
+                    return_value=[
+                        {"_id": "old", "vector": [0.1, 0.2, 0.3, 0.4]},
+                        {"_id": "new", "vector": _encode_vector(np.ones(4))},
+                    ]
+                )
+            )
+        )
+
+        vectors = await storage.get_vectors_by_ids(["old", "new"])
+
+        assert vectors == {"old": [0.1, 0.2, 0.3, 0.4], "new": [1.0] * 4}
+
+    @pytest.mark.asyncio
+    async def test_upsert_stores_binary_float32_vectors(self):
+        storage = self._make_storage()
+
+        await storage.upsert(
+            {
+                "chunk-1": {"content": "a", "tokens": 1},
+                "chunk-2": {"content": "bb"},
+                "chunk-3": {"content": "ccc"},
+            }
+        )
+
+        # One unordered bulk_write per embedding batch (batch size 2)
+        calls = storage._data.bulk_write.await_args_list
+        assert len(calls) == 2
+        assert all(call.kwargs["ordered"] is False for call in calls)
+        docs = [op._doc["$set"] for call in calls for op in call.args[0]]
+        assert [doc["_id"] for doc in docs] == ["chunk-1", "chunk-2", "chunk-3"]
+        assert _decode_vector(docs[2]["vector"]) == [3.0] * 4
+        # Only configured meta fields are stored alongside the vector
+        assert set(docs[0]) == {"_id", "created_at", "content", "vector"}
+
+    @pytest.mark.asyncio
+    async def test_create_vector_index_applies_configured_quantization(
+        self, monkeypatch
+    ):
+        monkeypatch.setattr("lightrag.kg.mongo_impl._vector_indexes_ready", set())
+        storage = self._make_storage()
+        storage._index_name = "vector_knn_index"
+        storage._quantization = "scalar"
+        storage.embedding_func = SimpleNamespace(embedding_dim=4)
+        storage._data.list_search_indexes = AsyncMock(
+            return_value=Mock(to_list=AsyncMock(return_value=[]))
+        )
+
+        await storage.create_vector_index_if_not_exists()
+
+        model = storage._data.create_search_index.await_args.args[0]
+        (vector_field,) = model.document["definition"]["fields"]
+        assert vector_field["quantization"] == "scalar"
+        assert vector_field["numDimensions"] == 4
+
+    @pytest.mark.asyncio
+    async def test_create_vector_index_lists_search_indexes_once(self, monkeypatch):
+        monkeypatch.setattr("lightrag.kg.mongo_impl._vector_indexes_ready", set())
+        storage = self._make_storage()
+        storage._index_name = "vector_knn_index"
+        storage._quantization = "none"
+        storage.embedding_func = SimpleNamespace(embedding_dim=4)
+        existing = {
+            "name": "vector_knn_index",
+            "latestDefinition": {
+                "fields": [{"type": "vector", "path": "vector", "numDimensions": 4}]
+            },
+        }
+        storage._data.database = SimpleNamespace(name="LightRAG")
+        storage._data.list_search_indexes = AsyncMock(
+            return_value=Mock(to_list=AsyncMock(return_value=[existing]))
+        )
+
+        await storage.create_vector_index_if_not_exists()
+        await storage.create_vector_index_if_not_exists()
+
+        storage._data.list_search_indexes.assert_awaited_once()
+        storage._data.create_search_index.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_create_vector_index_rechecks_dimension_for_other_config(
+        self, monkeypatch
+    ):
+        monkeypatch.setattr("lightrag.kg.mongo_impl._vector_indexes_ready", set())
+        existing = {
+            "name": "vector_knn_index",
+            "latestDefinition": {
+                "fields": [{"type": "vector", "path": "vector", "numDimensions": 4}]
+            },
+        }
+        storages = []
+        for dim in (4, 8):
+            storage = self._make_storage()
+            storage._index_name = "vector_knn_index"
+            storage._quantization = "none"
+            storage.embedding_func = SimpleNamespace(embedding_dim=dim)
+            storage._data.database = SimpleNamespace(name="LightRAG")
+            storage._data.list_search_indexes = AsyncMock(
+                return_value=Mock(to_list=AsyncMock(return_value=[existing]))
+            )
+            storages.append(storage)
+
+        await storages[0].create_vector_index_if_not_exists()
+        with pytest.raises(ValueError, match="dimension mismatch"):
+            await storages[1].create_vector_index_if_not_exists()
+
+    @pytest.mark.asyncio
+    async def test_delete_entity_relation_is_single_delete(self):
+        storage = self._make_storage()
+        storage._data.delete_many = AsyncMock(
+            return_value=SimpleNamespace(deleted_count=2)
+        )
+
+        await storage.delete_entity_relation("Alice")
+
+        storage._data.find.assert_not_called()
+        storage._data.delete_many.assert_awaited_once_with(
+            {"$or": [{"src_id": "Alice"}, {"tgt_id": "Alice"}]}
+        )
+
+    @pytest.mark.asyncio
+    async def test_query_shapes_results_in_pipeline_and_caps_batch(self, monkeypatch):
+        monkeypatch.delenv("MONGODB_WORKSPACE", raising=False)
+        storage = MongoVectorDBStorage(
+            namespace="chunks",
+            global_config={
+                "embedding_batch_num": 2,
+                "vector_db_storage_cls_kwargs": {"cosine_better_than_threshold": 0.2},
+            },
+            embedding_func=SimpleNamespace(embedding_dim=4),
+        )
+        storage._data = AsyncMock()
+        hits = [{"_id": "chunk-1", "id": "chunk-1", "distance": 0.9}]
+        cursor = Mock(to_list=AsyncMock(return_value=hits))
+        storage._data.aggregate = AsyncMock(return_value=cursor)
+
+        results = await storage.query("q", top_k=5, query_embedding=[1.0] * 4)
+
+        assert results == hits
+        pipeline = storage._data.aggregate.await_args.args[0]
+        assert pipeline[0]["$vectorSearch"]["limit"] == 5
+        query_vector = pipeline[0]["$vectorSearch"]["queryVector"]
+        assert query_vector.subtype == 9
+        assert _decode_vector(query_vector) == [1.0] * 4
+        assert pipeline[0]["$vectorSearch"]["index"] == "vector_knn_index"
+        assert pipeline[2] == {"$match": {"score": {"$gte": 0.2}}}
+        assert pipeline[-1]["$addFields"]["distance"] == "$score"
+        assert storage._data.aggregate.await_args.kwargs["batchSize"] == 5
+        cursor.to_list.assert_awaited_once_with(length=5)
+
+
+@pytest.mark.asyncio
+async def test_client_manager_reuses_cached_db_without_lock(monkeypatch):
+    sentinel_db = object()
+    monkeypatch.setattr(
+        ClientManager, "_instances", {"db": sentinel_db, "ref_count": 1}
+    )
+    lock = AsyncMock()
+    monkeypatch.setattr(ClientManager, "_lock", lock)
+
+    db = await ClientManager.get_client()
+
+    assert db is sentinel_db
+    assert ClientManager._instances["ref_count"] == 2
+    lock.__aenter__.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_collection_lists_names_once(monkeypatch):
+    monkeypatch.setattr("lightrag.kg.mongo_impl._collection_names_cache", {})
+    db = SimpleNamespace(
+        name="LightRAG",
+        list_collection_names=AsyncMock(return_value=["existing"]),
+        create_collection=AsyncMock(return_value="created"),
+        get_collection=Mock(return_value="fetched"),
+    )
+
+    assert await get_or_create_collection(db, "existing") == "fetched"
+    assert await get_or_create_collection(db, "new") == "created"
+    assert await get_or_create_collection(db, "new") == "fetched"
+
+    db.list_collection_names.assert_awaited_once()
+    db.create_collection.assert_awaited_once_with("new")
+
+
+@pytest.mark.asyncio
+async def test_client_manager_only_passes_configured_pool_options(monkeypatch):
+    created = []
+
+    class _Client:
+        def __init__(self, uri, **kwargs):
+            created.append(kwargs)
+
+        def get_database(self, name):
+            return object()
+
+    for key in (
+        "MONGO_MAX_POOL_SIZE",
+        "MONGO_MIN_POOL_SIZE",
+        "MONGO_MAX_IDLE_TIME_MS",
+        "MONGO_COMPRESSORS",
+    ):
+        monkeypatch.delenv(key, raising=False)
+    monkeypatch.setenv("MONGO_MAX_POOL_SIZE", "50")
+    monkeypatch.setattr("lightrag.kg.mongo_impl.AsyncMongoClient", _Client)
+    monkeypatch.setattr(ClientManager, "_instances", {"db": None, "ref_count": 0})
+
+    await ClientManager.get_client()
+
+    (kwargs,) = created
+    kwargs.pop("driver")
+    # Unset options are left to the URI / driver defaults
+    assert kwargs == {"maxPoolSize": 50}